@@ -0,0 +1,28 @@
+"""Color value classes shared across the framework."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RGBColor:
+    """An 8-bit RGB color."""
+    r: int
+    g: int
+    b: int
+
+    @property
+    def values(self) -> tuple[int, int, int]:
+        return self.r, self.g, self.b
+
+    @property
+    def normalized(self) -> tuple[float, float, float]:
+        return self.r / 255.0, self.g / 255.0, self.b / 255.0
+
+    @property
+    def css(self) -> str:
+        return f'rgb({self.r}, {self.g}, {self.b})'
+
+
+DEFAULT_BOXY_COLOR: RGBColor = RGBColor(102, 204, 255)
@@ -0,0 +1,31 @@
+"""Shared enumerations for the Maya 2025 framework."""
+
+from enum import Enum, IntEnum, unique
+
+
+@unique
+class Axis(IntEnum):
+    x = 0
+    y = 1
+    z = 2
+
+
+@unique
+class Side(IntEnum):
+    """Integer-valued so members hash like ints and can index tables.
+
+    bottom/center/top match the boxy shape's pivot enum indices.
+    """
+    bottom = 0
+    center = 1
+    top = 2
+    left = 3
+    right = 4
+    front = 5
+    back = 6
+
+
+@unique
+class SurfaceDirection(Enum):
+    concave = 'concave'
+    convex = 'convex'
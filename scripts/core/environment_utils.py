@@ -0,0 +1,15 @@
+"""Paths and environment helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+PROJECT_ROOT: Path = Path(__file__).parents[2]
+ICONS_FOLDER: Path = PROJECT_ROOT / 'icons'
+
+
+def image_path(image_name: str) -> str:
+    """Absolute path of an image in the icons folder.
+    :param image_name: file name of the image
+    """
+    return str(ICONS_FOLDER / image_name)
@@ -0,0 +1,163 @@
+"""Scalar math helpers for points and rotations."""
+
+from __future__ import annotations
+
+import functools
+import math
+
+from core.point_classes import Point3
+
+
+def apply_euler_xyz_rotation(point: Point3, rotation: Point3) -> Point3:
+    """Rotate a point about the origin by an XYZ euler rotation in degrees.
+
+    Delegates to the memoized rotation matrix, so loops applying the
+    same rotation to many points pay for the trig once.
+    :param point: point to rotate
+    :param rotation: euler rotation in degrees, applied x then y then z
+    """
+    matrix = cached_euler_xyz_rotation_matrix(rotation.x, rotation.y, rotation.z)
+
+    return apply_rotation_matrix(matrix, point)
+
+
+def euler_xyz_rotation_matrix(rotation: Point3) -> tuple[float, float, float, float, float, float,
+                                                         float, float, float]:
+    """Row-major 3x3 matrix for an XYZ euler rotation in degrees.
+
+    Applying the matrix is equivalent to apply_euler_xyz_rotation
+    without recomputing the six trig terms per point.
+    :param rotation: euler rotation in degrees
+    """
+    rx = math.radians(rotation.x)
+    ry = math.radians(rotation.y)
+    rz = math.radians(rotation.z)
+    cos_x, sin_x = math.cos(rx), math.sin(rx)
+    cos_y, sin_y = math.cos(ry), math.sin(ry)
+    cos_z, sin_z = math.cos(rz), math.sin(rz)
+
+    return (
+        cos_y * cos_z, sin_x * sin_y * cos_z - cos_x * sin_z, cos_x * sin_y * cos_z + sin_x * sin_z,
+        cos_y * sin_z, sin_x * sin_y * sin_z + cos_x * cos_z, cos_x * sin_y * sin_z - sin_x * cos_z,
+        -sin_y, sin_x * cos_y, cos_x * cos_y,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def cached_euler_xyz_rotation_matrix(x: float, y: float, z: float) -> tuple[
+        float, float, float, float, float, float, float, float, float]:
+    """Memoized euler_xyz_rotation_matrix keyed on the angle components.
+
+    Repeated rotations by the same angles - common when processing many
+    points or nodes sharing one orientation - skip the six trig calls.
+    :param x: x rotation in degrees
+    :param y: y rotation in degrees
+    :param z: z rotation in degrees
+    """
+    return euler_xyz_rotation_matrix(Point3(x, y, z))
+
+
+def apply_rotation_matrix(matrix: tuple[float, ...], point: Point3) -> Point3:
+    """Apply a row-major 3x3 rotation matrix to a point.
+    :param matrix: matrix from euler_xyz_rotation_matrix
+    :param point: point to rotate
+    """
+    x, y, z = point.x, point.y, point.z
+
+    return Point3(
+        matrix[0] * x + matrix[1] * y + matrix[2] * z,
+        matrix[3] * x + matrix[4] * y + matrix[5] * z,
+        matrix[6] * x + matrix[7] * y + matrix[8] * z,
+    )
+
+
+def apply_inverse_rotation_matrix(matrix: tuple[float, ...], point: Point3) -> Point3:
+    """Apply the inverse of a row-major 3x3 rotation matrix to a point.
+
+    Rotation matrices are orthonormal, so the inverse is the transpose;
+    indexing the columns applies it without building a second matrix.
+    :param matrix: matrix from euler_xyz_rotation_matrix
+    :param point: point to un-rotate
+    """
+    x, y, z = point.x, point.y, point.z
+
+    return Point3(
+        matrix[0] * x + matrix[3] * y + matrix[6] * z,
+        matrix[1] * x + matrix[4] * y + matrix[7] * z,
+        matrix[2] * x + matrix[5] * y + matrix[8] * z,
+    )
+
+
+def apply_euler_xyz_rotation_to_points(points: list[Point3], rotation: Point3) -> list[Point3]:
+    """Rotate many points about the origin by one XYZ euler rotation.
+
+    The rotation matrix is built once for the whole batch, so per-point
+    cost is nine multiplies instead of the full trig evaluation.
+    :param points: points to rotate
+    :param rotation: euler rotation in degrees, applied x then y then z
+    """
+    if rotation.x == 0.0 and rotation.y == 0.0 and rotation.z == 0.0:
+        return list(points)
+
+    matrix = cached_euler_xyz_rotation_matrix(rotation.x, rotation.y, rotation.z)
+
+    return [apply_rotation_matrix(matrix, point) for point in points]
+
+
+@functools.lru_cache(maxsize=64)
+def _y_rotation_terms(y_rotation: float) -> tuple[float, float]:
+    """Memoized cosine and sine of a y rotation in degrees.
+    :param y_rotation: rotation in degrees
+    """
+    angle = math.radians(y_rotation)
+
+    return math.cos(angle), math.sin(angle)
+
+
+def rotate_point_about_y(point: Point3, y_rotation: float, pivot: Point3 | None = None) -> Point3:
+    """Rotate a point about a vertical axis through a pivot.
+    :param point: point to rotate
+    :param y_rotation: rotation in degrees
+    :param pivot: pivot point; defaults to the origin
+    """
+    cos_a, sin_a = _y_rotation_terms(y_rotation)
+    pivot_x, pivot_z = (pivot.x, pivot.z) if pivot else (0.0, 0.0)
+    dx = point.x - pivot_x
+    dz = point.z - pivot_z
+
+    return Point3(pivot_x + dx * cos_a + dz * sin_a, point.y, pivot_z - dx * sin_a + dz * cos_a)
+
+
+def get_minimum_maximum_from_points(points: list[Point3], y_offset: float = 0.0,
+                                    pivot: Point3 | None = None) -> tuple[Point3, Point3]:
+    """Componentwise minimum and maximum of a point list.
+    :param points: points to evaluate
+    :param y_offset: optional rotation in degrees applied about y before evaluation
+    :param pivot: pivot for the optional rotation
+    """
+    assert points, 'No points supplied'
+
+    min_x = min_y = min_z = math.inf
+    max_x = max_y = max_z = -math.inf
+
+    if y_offset != 0.0:
+        cos_a, sin_a = _y_rotation_terms(y_offset)
+        pivot_x, pivot_z = (pivot.x, pivot.z) if pivot else (0.0, 0.0)
+
+        for point in points:
+            dx = point.x - pivot_x
+            dz = point.z - pivot_z
+            x = pivot_x + dx * cos_a + dz * sin_a
+            y = point.y
+            z = pivot_z - dx * sin_a + dz * cos_a
+            min_x, max_x = min(min_x, x), max(max_x, x)
+            min_y, max_y = min(min_y, y), max(max_y, y)
+            min_z, max_z = min(min_z, z), max(max_z, z)
+    else:
+        for point in points:
+            x, y, z = point.x, point.y, point.z
+            min_x, max_x = min(min_x, x), max(max_x, x)
+            min_y, max_y = min(min_y, y), max(max_y, y)
+            min_z, max_z = min(min_z, z), max(max_z, z)
+
+    return Point3(min_x, min_y, min_z), Point3(max_x, max_y, max_z)
@@ -0,0 +1,86 @@
+"""Lightweight point/vector value classes shared across the framework."""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Point3:
+    """A three-component point or vector.
+
+    Frozen with slots: instances are hashable values without a
+    per-instance __dict__, which keeps the many short-lived points in
+    the bounds and rotation paths cheap.
+    """
+    x: float
+    y: float
+    z: float
+
+    def __repr__(self) -> str:
+        return f'Point3({self.x}, {self.y}, {self.z})'
+
+    def __add__(self, other: Point3) -> Point3:
+        return Point3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: Point3) -> Point3:
+        return Point3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self) -> Point3:
+        return Point3(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other: Point3 | float) -> Point3:
+        if isinstance(other, Point3):
+            return Point3(self.x * other.x, self.y * other.y, self.z * other.z)
+
+        return Point3(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    @property
+    def values(self) -> tuple[float, float, float]:
+        return self.x, self.y, self.z
+
+    @property
+    def magnitude(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    @property
+    def normalized(self) -> Point3:
+        magnitude = self.magnitude
+
+        if magnitude == 0.0:
+            return Point3(0.0, 0.0, 0.0)
+
+        return Point3(self.x / magnitude, self.y / magnitude, self.z / magnitude)
+
+
+@dataclass
+class Point3Pair:
+    """A pair of points defining a span, or two vectors to compare."""
+    a: Point3
+    b: Point3
+
+    @property
+    def delta(self) -> Point3:
+        return Point3(self.b.x - self.a.x, self.b.y - self.a.y, self.b.z - self.a.z)
+
+    @property
+    def length(self) -> float:
+        return self.delta.magnitude
+
+    @property
+    def midpoint(self) -> Point3:
+        return Point3((self.a.x + self.b.x) * 0.5, (self.a.y + self.b.y) * 0.5, (self.a.z + self.b.z) * 0.5)
+
+    @property
+    def dot_product(self) -> float:
+        return self.a.x * self.b.x + self.a.y * self.b.y + self.a.z * self.b.z
+
+
+X_AXIS: Point3 = Point3(1.0, 0.0, 0.0)
+Y_AXIS: Point3 = Point3(0.0, 1.0, 0.0)
+Z_AXIS: Point3 = Point3(0.0, 0.0, 1.0)
+ORIGIN: Point3 = Point3(0.0, 0.0, 0.0)
@@ -0,0 +1,105 @@
+"""Bounds evaluation for selections and geometry."""
+
+from __future__ import annotations
+
+import logging
+
+from dataclasses import dataclass, field
+
+from maya import cmds
+
+from core import math_utils
+from core.point_classes import Point3
+from maya_tools import node_utils
+
+LOGGER = logging.getLogger(__name__)
+
+CUBOID_FACE_COUNT: int = 6
+
+
+@dataclass
+class Bounds:
+    """An oriented cuboid described by its size, center and rotation."""
+    size: Point3
+    position: Point3
+    rotation: Point3 = field(default_factory=lambda: Point3(0.0, 0.0, 0.0))
+
+    @classmethod
+    def from_min_max(cls, minimum: Point3, maximum: Point3) -> Bounds:
+        """Axis-aligned bounds from a minimum/maximum pair.
+        :param minimum: componentwise minimum
+        :param maximum: componentwise maximum
+        """
+        size = Point3(maximum.x - minimum.x, maximum.y - minimum.y, maximum.z - minimum.z)
+        position = Point3((minimum.x + maximum.x) * 0.5, (minimum.y + maximum.y) * 0.5,
+                          (minimum.z + maximum.z) * 0.5)
+
+        return cls(size=size, position=position)
+
+    @property
+    def minimum(self) -> Point3:
+        return Point3(self.position.x - self.size.x * 0.5, self.position.y - self.size.y * 0.5,
+                      self.position.z - self.size.z * 0.5)
+
+    @property
+    def maximum(self) -> Point3:
+        return Point3(self.position.x + self.size.x * 0.5, self.position.y + self.size.y * 0.5,
+                      self.position.z + self.size.z * 0.5)
+
+    @property
+    def center(self) -> Point3:
+        return self.position
+
+    @property
+    def base_center(self) -> Point3:
+        return Point3(self.position.x, self.position.y - self.size.y * 0.5, self.position.z)
+
+    @property
+    def top_center(self) -> Point3:
+        return Point3(self.position.x, self.position.y + self.size.y * 0.5, self.position.z)
+
+
+def get_bounds(geometry: list[str]) -> Bounds:
+    """Axis-aligned world-space bounds of components or transforms.
+    :param geometry: component strings or transform nodes
+    """
+    points = node_utils.get_points_from_selection(geometry)
+    minimum, maximum = math_utils.get_minimum_maximum_from_points(points)
+
+    return Bounds.from_min_max(minimum, maximum)
+
+
+def get_cuboid(geometry: list[str]) -> Bounds | None:
+    """Oriented bounds when the supplied geometry is a single cuboid mesh.
+
+    Returns None when the selection does not resolve to a whole
+    six-faced mesh, in which case callers fall back to get_bounds.
+    :param geometry: component strings or transform nodes
+    """
+    transforms = {item.split('.')[0] for item in geometry}
+
+    if len(transforms) != 1:
+        return None
+
+    transform = transforms.pop()
+    shape = node_utils.get_shape_from_transform(transform)
+
+    if shape is None or cmds.objectType(shape) != 'mesh':
+        return None
+
+    if cmds.polyEvaluate(transform, face=True) != CUBOID_FACE_COUNT:
+        return None
+
+    positions = cmds.xform(f'{transform}.vtx[*]', query=True, objectSpace=True, translation=True)
+    xs = positions[0::3]
+    ys = positions[1::3]
+    zs = positions[2::3]
+    scale = node_utils.get_scale(transform)
+    size = Point3((max(xs) - min(xs)) * scale.x, (max(ys) - min(ys)) * scale.y,
+                  (max(zs) - min(zs)) * scale.z)
+    rotation = node_utils.get_rotation(transform)
+    bounding_box = cmds.exactWorldBoundingBox(transform)
+    position = Point3((bounding_box[0] + bounding_box[3]) * 0.5, (bounding_box[1] + bounding_box[4]) * 0.5,
+                      (bounding_box[2] + bounding_box[5]) * 0.5)
+
+    return Bounds(size=size, position=position, rotation=rotation)
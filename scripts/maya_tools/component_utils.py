@@ -0,0 +1,73 @@
+"""Utilities for working with polygon components."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from maya import cmds
+
+from core.point_classes import Point3
+
+COMPONENT_SUFFIXES: tuple[str, ...] = ('.vtx', '.e', '.f')
+
+
+@dataclass
+class FaceData:
+    """Name, world-space center and world-space normal of a polygon face."""
+    name: str
+    center: Point3
+    normal: Point3
+
+
+def components_from_selection(selection: list[str] | None = None) -> list[str]:
+    """Flattened component strings from the supplied or current selection.
+    :param selection: optional selection list; defaults to the current selection
+    """
+    if selection is None:
+        selection = cmds.ls(selection=True, flatten=True) or []
+
+    return [x for x in selection if any(suffix in x for suffix in COMPONENT_SUFFIXES)]
+
+
+def get_mesh_faces(transform: str) -> list[str]:
+    """All face component strings of a mesh transform.
+    :param transform: mesh transform node
+    """
+    return cmds.ls(f'{transform}.f[*]', flatten=True) or []
+
+
+def get_face_center(face: str) -> Point3:
+    """World-space center of a polygon face.
+    :param face: face component string, e.g. 'pCube1.f[3]'
+    """
+    positions = cmds.xform(face, query=True, worldSpace=True, translation=True)
+    count = len(positions) // 3
+    x = sum(positions[0::3]) / count
+    y = sum(positions[1::3]) / count
+    z = sum(positions[2::3]) / count
+
+    return Point3(x, y, z)
+
+
+def get_face_normal(face: str) -> Point3:
+    """World-space normal of a polygon face.
+    :param face: face component string, e.g. 'pCube1.f[3]'
+    """
+    info = cmds.polyInfo(face, faceNormals=True)[0]
+    nx, ny, nz = (float(value) for value in info.split(':')[1].split())
+    transform = face.split('.')[0]
+    matrix = cmds.xform(transform, query=True, worldSpace=True, matrix=True)
+    world = Point3(
+        nx * matrix[0] + ny * matrix[4] + nz * matrix[8],
+        nx * matrix[1] + ny * matrix[5] + nz * matrix[9],
+        nx * matrix[2] + ny * matrix[6] + nz * matrix[10],
+    )
+
+    return world.normalized
+
+
+def get_face_data(face: str) -> FaceData:
+    """FaceData for a face component string.
+    :param face: face component string, e.g. 'pCube1.f[3]'
+    """
+    return FaceData(name=face, center=get_face_center(face), normal=get_face_normal(face))
@@ -0,0 +1,197 @@
+"""Utilities for querying and editing Maya nodes."""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+from maya import cmds
+from maya.api import OpenMaya as om
+
+from core.color_classes import RGBColor
+from core.point_classes import Point3
+
+LOGGER = logging.getLogger(__name__)
+
+
+@contextmanager
+def undo_chunk(name: str = 'operation'):
+    """Group everything executed in the block into a single undo entry.
+    :param name: label for the undo chunk
+    """
+    cmds.undoInfo(openChunk=True, chunkName=name)
+
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def get_m_object(node: str) -> om.MObject:
+    """MObject for a node name.
+    :param node: node name
+    """
+    selection_list = om.MSelectionList()
+    selection_list.add(node)
+
+    return selection_list.getDependNode(0)
+
+
+def get_shape_from_transform(node: str) -> str | None:
+    """First shape node under a transform, if any.
+    :param node: transform node
+    """
+    shapes = cmds.listRelatives(node, shapes=True, noIntermediate=True)
+
+    return shapes[0] if shapes else None
+
+
+def get_translation(node: str) -> Point3:
+    """World-space translation of a transform.
+    :param node: transform node
+    """
+    return Point3(*cmds.xform(node, query=True, worldSpace=True, translation=True))
+
+
+def set_translation(node: str, value: Point3):
+    """Set the world-space translation of a transform.
+    :param node: transform node
+    :param value: translation to apply
+    """
+    cmds.setAttr(f'{node}.translate', value.x, value.y, value.z, type='double3')
+
+
+def get_rotation(node: str) -> Point3:
+    """Euler rotation of a transform in degrees.
+    :param node: transform node
+    """
+    return Point3(*cmds.xform(node, query=True, rotation=True))
+
+
+def set_rotation(node: str, value: Point3):
+    """Set the euler rotation of a transform in degrees.
+    :param node: transform node
+    :param value: rotation to apply
+    """
+    cmds.setAttr(f'{node}.rotate', value.x, value.y, value.z, type='double3')
+
+
+def get_scale(node: str) -> Point3:
+    """Scale of a transform.
+    :param node: transform node
+    """
+    return Point3(*cmds.getAttr(f'{node}.scale')[0])
+
+
+def set_scale(node: str, value: Point3):
+    """Set the scale of a transform.
+    :param node: transform node
+    :param value: scale to apply
+    """
+    cmds.setAttr(f'{node}.scale', value.x, value.y, value.z, type='double3')
+
+
+TransformSnapshot = namedtuple('TransformSnapshot', ['translation', 'rotation', 'scale'])
+
+
+def get_transform_snapshot(node: str) -> TransformSnapshot:
+    """Translation, rotation and scale read in a single API transaction.
+
+    Goes through MFnTransform rather than the command engine, so the
+    three values cost one node lookup instead of three command
+    round-trips.
+    :param node: transform node
+    """
+    selection_list = om.MSelectionList()
+    selection_list.add(node)
+    transform_fn = om.MFnTransform(selection_list.getDagPath(0))
+    translation = transform_fn.translation(om.MSpace.kWorld)
+    rotation = transform_fn.rotation()
+    scale = transform_fn.scale()
+
+    return TransformSnapshot(
+        translation=Point3(translation.x, translation.y, translation.z),
+        rotation=Point3(math.degrees(rotation.x), math.degrees(rotation.y),
+                        math.degrees(rotation.z)),
+        scale=Point3(*scale),
+    )
+
+
+def get_selected_transforms() -> list[str]:
+    """Transform nodes in the current selection."""
+    return cmds.ls(selection=True, type='transform') or []
+
+
+def get_points_from_selection(selection: list[str] | None = None) -> list[Point3]:
+    """World-space point positions for components or transforms.
+    :param selection: component strings or transform nodes; defaults to the current selection
+    """
+    if selection is None:
+        selection = cmds.ls(selection=True, flatten=True) or []
+
+    points = []
+
+    for item in selection:
+        if '.' in item:
+            positions = cmds.xform(item, query=True, worldSpace=True, translation=True)
+        else:
+            positions = cmds.xform(f'{item}.vtx[*]' if is_geometry(item) else item,
+                                   query=True, worldSpace=True, translation=True)
+
+        for index in range(0, len(positions), 3):
+            points.append(Point3(positions[index], positions[index + 1], positions[index + 2]))
+
+    return points
+
+
+def _shape_type_is(node: str, node_type: str) -> bool:
+    """True when a node or its shape is of the supplied type.
+    :param node: node name
+    :param node_type: object type to test against
+    """
+    if cmds.objectType(node) == node_type:
+        return True
+
+    shape = get_shape_from_transform(node)
+
+    return shape is not None and cmds.objectType(shape) == node_type
+
+
+def is_boxy(node: str) -> bool:
+    """True when a node is a boxy transform or shape.
+    :param node: node name
+    """
+    return _shape_type_is(node, 'boxyShape')
+
+
+def is_locator(node: str) -> bool:
+    """True when a node is a locator transform or shape.
+    :param node: node name
+    """
+    return _shape_type_is(node, 'locator')
+
+
+def is_geometry(node: str) -> bool:
+    """True when a node is a mesh transform or shape.
+    :param node: node name
+    """
+    return _shape_type_is(node, 'mesh')
+
+
+def is_nurbs_curve(node: str) -> bool:
+    """True when a node is a nurbs curve transform or shape.
+    :param node: node name
+    """
+    return _shape_type_is(node, 'nurbsCurve')
+
+
+def set_wireframe_color(shape: str, color: RGBColor):
+    """Set the wireframe color attributes of a boxy shape.
+    :param shape: boxy shape node
+    :param color: 8-bit color to apply
+    """
+    r, g, b = color.normalized
+    cmds.setAttr(f'{shape}.wireframeColor', r, g, b, type='float3')
@@ -0,0 +1,377 @@
+"""Boxy shape plug-in.
+
+A boxy is a lightweight wireframe cuboid drawn in the viewport by a
+custom shape node. Boxies stand in for blockout geometry without the
+weight of real polygon meshes.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from maya import cmds
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaRender as omr
+from maya.api import OpenMayaUI as omui
+
+from core.color_classes import RGBColor, DEFAULT_BOXY_COLOR
+from core.core_enums import Side
+from core.point_classes import Point3, ORIGIN
+from maya_tools import node_utils
+
+maya_useNewAPI = True
+
+LOGGER = logging.getLogger(__name__)
+
+PLUGIN_PATH: str = __file__
+DEFAULT_COLOR: tuple[float, float, float] = DEFAULT_BOXY_COLOR.normalized
+DEFAULT_SIZE: float = 1.0
+PIVOT_SIDES: tuple[Side, Side, Side] = (Side.bottom, Side.center, Side.top)
+_BOXY_EDGES: tuple[tuple[int, int], ...] = (
+    (0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7))
+_LINE_ENDPOINTS_IDX: tuple[int, ...] = tuple(index for edge in _BOXY_EDGES for index in edge)
+_DEFAULT_MCOLOR = om.MColor([*DEFAULT_COLOR, 1.0])
+_PIVOT_Y_MUL: tuple[float, float, float] = (0.5, 0.0, -0.5)
+_CUBE_SIGNS: tuple[tuple[int, int, int], ...] = (
+    (-1, 0, -1), (1, 0, -1), (1, 0, 1), (-1, 0, 1),
+    (-1, 1, -1), (1, 1, -1), (1, 1, 1), (-1, 1, 1))
+
+
+class BoxyShape(omui.MPxLocatorNode):
+    """Custom shape holding the size, pivot and display color of a boxy."""
+
+    TYPE_NAME = 'boxyShape'
+    TYPE_ID = om.MTypeId(0x0007F7B0)
+    DRAW_CLASSIFICATION = 'drawdb/geometry/boxyShape'
+    DRAW_REGISTRANT_ID = 'BoxyShapePlugin'
+
+    size = None
+    sizeX = None
+    sizeY = None
+    sizeZ = None
+    pivot = None
+    previousPivot = None
+    preservePivotPosition = None
+    wireframeColor = None
+    wireframeColorR = None
+    wireframeColorG = None
+    wireframeColorB = None
+    magnitude = None
+    cachedBoundsValid = None
+    cachedBoundsMin = None
+    cachedBoundsMax = None
+
+    _callbacks: dict[om.MObjectHandle, int] = {}
+
+    def __init__(self):
+        super().__init__()
+
+    @classmethod
+    def creator(cls):
+        return cls()
+
+    @classmethod
+    def initialize(cls):
+        numeric_fn = om.MFnNumericAttribute()
+        enum_fn = om.MFnEnumAttribute()
+
+        cls.sizeX = numeric_fn.create('sizeX', 'szx', om.MFnNumericData.kFloat, DEFAULT_SIZE)
+        cls.sizeY = numeric_fn.create('sizeY', 'szy', om.MFnNumericData.kFloat, DEFAULT_SIZE)
+        cls.sizeZ = numeric_fn.create('sizeZ', 'szz', om.MFnNumericData.kFloat, DEFAULT_SIZE)
+        numeric_fn = om.MFnNumericAttribute()
+        cls.size = numeric_fn.create('size', 'sz', cls.sizeX, cls.sizeY, cls.sizeZ)
+        numeric_fn.keyable = True
+        cls.addAttribute(cls.size)
+
+        cls.pivot = enum_fn.create('pivot', 'piv', 1)
+
+        for index, side in enumerate(PIVOT_SIDES):
+            enum_fn.addField(side.name, index)
+
+        enum_fn.keyable = True
+        cls.addAttribute(cls.pivot)
+
+        enum_fn = om.MFnEnumAttribute()
+        cls.previousPivot = enum_fn.create('previousPivot', 'ppiv', 1)
+
+        for index, side in enumerate(PIVOT_SIDES):
+            enum_fn.addField(side.name, index)
+
+        enum_fn.hidden = True
+        cls.addAttribute(cls.previousPivot)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.preservePivotPosition = numeric_fn.create(
+            'preservePivotPosition', 'ppp', om.MFnNumericData.kBoolean, True)
+        cls.addAttribute(cls.preservePivotPosition)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.wireframeColorR = numeric_fn.create('wireframeColorR', 'wcr', om.MFnNumericData.kFloat, DEFAULT_COLOR[0])
+        cls.wireframeColorG = numeric_fn.create('wireframeColorG', 'wcg', om.MFnNumericData.kFloat, DEFAULT_COLOR[1])
+        cls.wireframeColorB = numeric_fn.create('wireframeColorB', 'wcb', om.MFnNumericData.kFloat, DEFAULT_COLOR[2])
+        numeric_fn = om.MFnNumericAttribute()
+        cls.wireframeColor = numeric_fn.create(
+            'wireframeColor', 'wc', cls.wireframeColorR, cls.wireframeColorG, cls.wireframeColorB)
+        cls.addAttribute(cls.wireframeColor)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.magnitude = numeric_fn.create('magnitude', 'mag', om.MFnNumericData.kFloat, 0.0)
+        numeric_fn.writable = False
+        numeric_fn.storable = False
+        cls.addAttribute(cls.magnitude)
+
+        cls.attributeAffects(cls.size, cls.magnitude)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.cachedBoundsValid = numeric_fn.create(
+            'cachedBoundsValid', 'cbv', om.MFnNumericData.kBoolean, False)
+        numeric_fn.hidden = True
+        cls.addAttribute(cls.cachedBoundsValid)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.cachedBoundsMin = numeric_fn.create('cachedBoundsMin', 'cbmn', om.MFnNumericData.k3Float)
+        numeric_fn.hidden = True
+        cls.addAttribute(cls.cachedBoundsMin)
+
+        numeric_fn = om.MFnNumericAttribute()
+        cls.cachedBoundsMax = numeric_fn.create('cachedBoundsMax', 'cbmx', om.MFnNumericData.k3Float)
+        numeric_fn.hidden = True
+        cls.addAttribute(cls.cachedBoundsMax)
+
+    def postConstructor(self):
+        this_node = self.thisMObject()
+        callback_id = om.MNodeMessage.addAttributeChangedCallback(this_node, _on_attribute_changed)
+        BoxyShape._callbacks[om.MObjectHandle(this_node)] = callback_id
+
+    @classmethod
+    def remove_callbacks(cls):
+        """Deregister all attribute-changed callbacks registered by shapes."""
+        for callback_id in cls._callbacks.values():
+            om.MMessage.removeCallback(callback_id)
+
+        cls._callbacks.clear()
+
+    def compute(self, plug, data_block):
+        if plug != BoxyShape.magnitude:
+            return
+
+        size_handle = data_block.inputValue(BoxyShape.size)
+        sx = size_handle.child(BoxyShape.sizeX).asFloat()
+        sy = size_handle.child(BoxyShape.sizeY).asFloat()
+        sz = size_handle.child(BoxyShape.sizeZ).asFloat()
+        magnitude = math.hypot(sx, sy, sz)
+        output_handle = data_block.outputValue(BoxyShape.magnitude)
+        output_handle.setFloat(magnitude)
+        data_block.setClean(plug)
+
+
+def _on_attribute_changed(msg, plug, other_plug, client_data):
+    """Shift the transform when the pivot changes so the drawn box stays put.
+
+    Also marks the cached bounds stale whenever an attribute feeding them
+    (size or pivot) is set.
+    """
+    if not msg & om.MNodeMessage.kAttributeSet:
+        return
+
+    attribute = plug.attribute()
+
+    if attribute in (BoxyShape.size, BoxyShape.sizeX, BoxyShape.sizeY, BoxyShape.sizeZ):
+        fn = om.MFnDependencyNode(plug.node())
+        fn.findPlug(BoxyShape.cachedBoundsValid, False).setBool(False)
+        return
+
+    if attribute != BoxyShape.pivot:
+        return
+
+    node = plug.node()
+    fn = om.MFnDependencyNode(node)
+    fn.findPlug(BoxyShape.cachedBoundsValid, False).setBool(False)
+
+    if not fn.findPlug(BoxyShape.preservePivotPosition, False).asBool():
+        fn.findPlug(BoxyShape.previousPivot, False).setShort(plug.asShort())
+        return
+
+    old_pivot = fn.findPlug(BoxyShape.previousPivot, False).asShort()
+    new_pivot = plug.asShort()
+    height = fn.findPlug(BoxyShape.sizeY, False).asFloat()
+    delta = _PIVOT_Y_MUL[old_pivot] * height - _PIVOT_Y_MUL[new_pivot] * height
+
+    dag_fn = om.MFnDagNode(node)
+    parent = om.MFnDagNode(dag_fn.parent(0))
+    transform_fn = om.MFnDependencyNode(parent.object())
+    translate_y = transform_fn.findPlug('translateY', False)
+    translate_y.setDouble(translate_y.asDouble() + delta)
+    fn.findPlug(BoxyShape.previousPivot, False).setShort(new_pivot)
+
+
+class BoxyUserData(om.MUserData):
+    """Per-node draw cache passed between prepareForDraw and addUIDrawables."""
+
+    def __init__(self):
+        super().__init__(False)
+        self.vertices: list[om.MPoint] = []
+        self.color = _DEFAULT_MCOLOR
+        self._key: tuple | None = None
+
+
+class BoxyDrawOverride(omr.MPxDrawOverride):
+    """Draws the boxy wireframe in Viewport 2.0."""
+
+    def __init__(self, obj):
+        super().__init__(obj, None, False)
+
+    @classmethod
+    def creator(cls, obj):
+        return cls(obj)
+
+    def supportedDrawAPIs(self):
+        return omr.MRenderer.kAllDevices
+
+    def isBounded(self, obj_path, camera_path):
+        return True
+
+    def boundingBox(self, obj_path, camera_path):
+        fn = om.MFnDependencyNode(obj_path.node())
+        sx = fn.findPlug(BoxyShape.sizeX, False).asFloat()
+        sy = fn.findPlug(BoxyShape.sizeY, False).asFloat()
+        sz = fn.findPlug(BoxyShape.sizeZ, False).asFloat()
+        pivot = fn.findPlug(BoxyShape.pivot, False).asShort()
+        y_min, y_max = _y_range(pivot, sy)
+
+        return om.MBoundingBox(
+            om.MPoint(-sx * 0.5, y_min, -sz * 0.5),
+            om.MPoint(sx * 0.5, y_max, sz * 0.5),
+        )
+
+    def prepareForDraw(self, obj_path, camera_path, frame_context, old_data):
+        data = old_data
+
+        if not isinstance(data, BoxyUserData):
+            data = BoxyUserData()
+
+        fn = om.MFnDependencyNode(obj_path.node())
+        sx = fn.findPlug(BoxyShape.sizeX, False).asFloat()
+        sy = fn.findPlug(BoxyShape.sizeY, False).asFloat()
+        sz = fn.findPlug(BoxyShape.sizeZ, False).asFloat()
+        pivot = fn.findPlug(BoxyShape.pivot, False).asShort()
+        color_r = fn.findPlug(BoxyShape.wireframeColorR, False).asFloat()
+        color_g = fn.findPlug(BoxyShape.wireframeColorG, False).asFloat()
+        color_b = fn.findPlug(BoxyShape.wireframeColorB, False).asFloat()
+        key = (sx, sy, sz, pivot, color_r, color_g, color_b)
+
+        if data._key == key:
+            return data
+
+        half_x = sx * 0.5
+        half_z = sz * 0.5
+        y_min, y_max = _y_range(pivot, sy)
+
+        data.vertices = [
+            om.MPoint(x_sign * half_x, y_max if y_index else y_min, z_sign * half_z)
+            for x_sign, y_index, z_sign in _CUBE_SIGNS
+        ]
+        data.color = om.MColor([color_r, color_g, color_b, 1.0])
+        data._key = key
+
+        return data
+
+    def hasUIDrawables(self):
+        return True
+
+    def addUIDrawables(self, obj_path, draw_manager, frame_context, data):
+        if not isinstance(data, BoxyUserData):
+            return
+
+        draw_manager.beginDrawable()
+        draw_manager.setColor(data.color)
+        points = om.MPointArray()
+
+        for index in _LINE_ENDPOINTS_IDX:
+            points.append(data.vertices[index])
+
+        draw_manager.mesh(omr.MUIDrawManager.kLines, points)
+        draw_manager.endDrawable()
+
+
+def _y_range(pivot: int, size_y: float) -> tuple[float, float]:
+    """Vertical extent of the drawn box for a pivot index.
+    :param pivot: pivot index (0 bottom, 1 center, 2 top)
+    :param size_y: box height
+    """
+    if pivot == 0:
+        return 0.0, size_y
+    elif pivot == 2:
+        return -size_y, 0.0
+
+    return -size_y * 0.5, size_y * 0.5
+
+
+_plugin_loaded: bool = False
+
+
+def _ensure_plugin_loaded():
+    """Load the boxy plug-in if it is not already loaded."""
+    global _plugin_loaded
+
+    if _plugin_loaded:
+        return
+
+    if not cmds.pluginInfo(PLUGIN_PATH, query=True, loaded=True):
+        cmds.loadPlugin(PLUGIN_PATH)
+
+    _plugin_loaded = True
+
+
+def build(name: str, size: Point3, position: Point3 = ORIGIN, rotation: Point3 = ORIGIN,
+          color: RGBColor = DEFAULT_BOXY_COLOR, pivot: Side = Side.center) -> str:
+    """Create a boxy and return its transform.
+    :param name: transform name
+    :param size: box dimensions
+    :param position: world-space translation
+    :param rotation: euler rotation in degrees
+    :param color: wireframe color
+    :param pivot: vertical pivot placement
+    """
+    _ensure_plugin_loaded()
+
+    with node_utils.undo_chunk(name='build_boxy'):
+        transform = cmds.createNode('transform', name=name, skipSelect=True)
+        shape = cmds.createNode(BoxyShape.TYPE_NAME, name=f'{transform}Shape', parent=transform, skipSelect=True)
+        cmds.setAttr(f'{shape}.size', size.x, size.y, size.z, type='float3')
+        pivot_index = PIVOT_SIDES.index(pivot)
+        cmds.setAttr(f'{shape}.previousPivot', pivot_index)
+        cmds.setAttr(f'{shape}.pivot', pivot_index)
+        cmds.xform(transform, translation=position.values, rotation=rotation.values)
+        node_utils.set_wireframe_color(shape, color)
+
+    return transform
+
+
+def create_boxy(size: float = DEFAULT_SIZE, color: RGBColor = DEFAULT_BOXY_COLOR,
+                pivot: Side = Side.center) -> str:
+    """Create a uniform boxy at the origin and return its transform.
+    :param size: uniform box dimension
+    :param color: wireframe color
+    :param pivot: vertical pivot placement
+    """
+    return build(name='boxy1', size=Point3(size, size, size), color=color, pivot=pivot)
+
+
+def initializePlugin(obj):
+    plugin = om.MFnPlugin(obj, 'ubertron', '1.0', 'Any')
+    plugin.registerNode(
+        BoxyShape.TYPE_NAME, BoxyShape.TYPE_ID, BoxyShape.creator, BoxyShape.initialize,
+        om.MPxNode.kLocatorNode, BoxyShape.DRAW_CLASSIFICATION)
+    omr.MDrawRegistry.registerDrawOverrideCreator(
+        BoxyShape.DRAW_CLASSIFICATION, BoxyShape.DRAW_REGISTRANT_ID, BoxyDrawOverride.creator)
+
+
+def uninitializePlugin(obj):
+    global _plugin_loaded
+    plugin = om.MFnPlugin(obj)
+    BoxyShape.remove_callbacks()
+    omr.MDrawRegistry.deregisterDrawOverrideCreator(BoxyShape.DRAW_CLASSIFICATION, BoxyShape.DRAW_REGISTRANT_ID)
+    plugin.deregisterNode(BoxyShape.TYPE_ID)
+    _plugin_loaded = False
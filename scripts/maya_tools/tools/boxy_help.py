@@ -0,0 +1,35 @@
+"""Help dialog for the Boxy tool."""
+
+from __future__ import annotations
+
+import functools
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout
+
+from maya_tools.utilities.boxy_version import VERSIONS
+
+HELP_TEXT: str = (
+    '<b>Boxy</b> creates lightweight wireframe cuboids from the current selection.<br>'
+    'Select components, locators, poly cubes or existing boxies and press Create.'
+)
+
+
+class BoxyHelp(QDialog):
+    """Displays usage notes and the version history."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(f'Boxy Help [v{VERSIONS.latest.version}]')
+        layout = QVBoxLayout(self)
+        label = QLabel(f'{HELP_TEXT}<br><br>{self._get_versions_text()}')
+        label.setTextFormat(Qt.RichText)
+        label.setWordWrap(True)
+        layout.addWidget(label)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_versions_text() -> str:
+        """Rich-text version history; the version list is immutable at runtime."""
+        return '<br>'.join(
+            f'&#8226; <b>v{v.version}</b> [{v.codename}]: {v.info}' for v in VERSIONS.versions)
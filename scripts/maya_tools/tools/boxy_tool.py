@@ -0,0 +1,457 @@
+"""Boxy tool window.
+
+Creates boxies from the current selection, converts between boxies and
+poly cubes, and derives boxies from opposing faces via the face finder.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+
+from contextlib import suppress
+from itertools import chain
+
+from maya import cmds
+from PySide6.QtCore import QObject, QSettings, QThread, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QIcon, QPalette, QPixmap
+from PySide6.QtWidgets import (QApplication, QCheckBox, QColorDialog, QComboBox, QDoubleSpinBox,
+                               QFormLayout, QLabel, QPushButton, QVBoxLayout, QWidget)
+
+from core.color_classes import RGBColor, DEFAULT_BOXY_COLOR
+from core.core_enums import Side, SurfaceDirection
+from core.environment_utils import image_path
+from maya_tools import node_utils
+from maya_tools.plug_ins import boxy_node
+from maya_tools.utilities import boxy_utils
+from maya_tools.utilities.boxy_utils import Boxy, BoxyException
+from widgets.button_bar import ButtonBar
+from widgets.widget_utils import get_widget_instances
+
+with suppress(ImportError):
+    from maya_tools.utilities import face_finder
+
+LOGGER = logging.getLogger(__name__)
+
+DEVELOPER: str = 'ubertron'
+TOOL_NAME: str = 'BoxyTool'
+PIVOT_SIDES: tuple[Side, ...] = (Side.bottom, Side.center, Side.top)
+LOGO_HEIGHT: int = 80
+SETTINGS_DEBOUNCE_MS: int = 250
+
+
+@functools.lru_cache(maxsize=None)
+def _icon(image_name: str) -> QIcon:
+    """Icon loaded once per image; re-launching the tool reuses it.
+    :param image_name: file name of the image
+    """
+    return QIcon(image_path(image_name))
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_pixmap() -> QPixmap:
+    return QPixmap(image_path('boxy_logo.png'))
+
+
+class _SettingsWriter(QObject):
+    """Persists settings from a worker thread.
+
+    QSettings instances are per-thread, so the writer builds its own on
+    first use rather than sharing the GUI thread's instance.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._settings: QSettings | None = None
+
+    def _get_settings(self) -> QSettings:
+        if self._settings is None:
+            self._settings = QSettings(DEVELOPER, TOOL_NAME)
+
+        return self._settings
+
+    @Slot(str, object)
+    def write(self, key: str, value):
+        self._get_settings().setValue(key, value)
+
+    @Slot()
+    def sync(self):
+        self._get_settings().sync()
+
+
+class _SettingsCache:
+    """In-memory front for QSettings.
+
+    Reads hit the dict after the first access; writes only persist when
+    the value actually changed, and go through the supplied write
+    callable so they can be delegated off the GUI thread.
+    """
+
+    def __init__(self, settings: QSettings, write=None):
+        self._settings = settings
+        self._write = write if write is not None else settings.setValue
+        self._cache: dict[str, object] = {}
+
+    def value(self, key: str, default=None):
+        if key not in self._cache:
+            self._cache[key] = self._settings.value(key, default)
+
+        return self._cache[key]
+
+    def set_value(self, key: str, value):
+        if self._cache.get(key) != value:
+            self._cache[key] = value
+            self._write(key, value)
+
+
+class BoxyTool(QWidget):
+    """Main window of the Boxy tool."""
+
+    write_requested = Signal(str, object)
+    sync_requested = Signal()
+
+    _instance: BoxyTool | None = None
+
+    color_key = 'wireframe_color'
+    inherit_rotation_key = 'inherit_rotation'
+    inherit_scale_key = 'inherit_scale'
+    pivot_key = 'pivot_index'
+    size_key = 'default_size'
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle(TOOL_NAME)
+        self.settings = QSettings(DEVELOPER, TOOL_NAME)
+        self._writer_thread = QThread(self)
+        self._writer = _SettingsWriter()
+        self._writer.moveToThread(self._writer_thread)
+        self.write_requested.connect(self._writer.write)
+        self.sync_requested.connect(self._writer.sync)
+        self._writer_thread.start()
+        QApplication.instance().aboutToQuit.connect(self._shutdown_writer)
+        self._cache = _SettingsCache(self.settings, write=self.write_requested.emit)
+        self._load_settings()
+        self._wireframe_color: RGBColor | None = None
+        self.logo = QLabel(parent=self)
+        self.button_bar = ButtonBar(parent=self)
+        self.size_field = QDoubleSpinBox(parent=self)
+        self.pivot_combo_box = QComboBox(parent=self)
+        self.rotation_check_box = QCheckBox('Inherit rotation', parent=self)
+        self.scale_check_box = QCheckBox('Inherit scale', parent=self)
+        self.color_picker = QPushButton(parent=self)
+        self.info_label = QLabel(parent=self)
+        self._pending_settings: dict[str, object] = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(SETTINGS_DEBOUNCE_MS)
+        self._settings_timer.timeout.connect(self._flush_pending_settings)
+        self._on_concave = functools.partial(self._create_boxy_from_face, SurfaceDirection.concave)
+        self._on_convex = functools.partial(self._create_boxy_from_face, SurfaceDirection.convex)
+        self._setup_ui()
+
+    @classmethod
+    def instance(cls) -> BoxyTool:
+        """The shared tool instance, built on first use.
+
+        Reusing the widget keeps the QSettings member, icons and layout
+        warm across launches instead of rebuilding them each time.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def _load_settings(self):
+        """Read stored settings once, coercing to native types.
+
+        QSettings backends return strings for booleans and numbers on
+        some platforms; coerce here so the rest of the tool never
+        repeats the conversion.
+        """
+        raw = self._cache.value(self.inherit_rotation_key, True)
+        self._inherit_rotation = raw if isinstance(raw, bool) else str(raw).lower() == 'true'
+        raw = self._cache.value(self.inherit_scale_key, True)
+        self._inherit_scale = raw if isinstance(raw, bool) else str(raw).lower() == 'true'
+        self._pivot_index = int(self._cache.value(self.pivot_key, 1))
+        self._default_size = float(self._cache.value(self.size_key, 1.0))
+        color_values = self._cache.value(self.color_key, DEFAULT_BOXY_COLOR.values)
+        self._color_values = tuple(int(value) for value in color_values)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        self.logo.setPixmap(_logo_pixmap())
+        self.button_bar.add_icon_button(
+            icon_path=_icon('boxy.png'), tool_tip='Create boxy from selection',
+            slot=self.create_button_clicked)
+        self.button_bar.add_icon_button(
+            icon_path=_icon('boxy_to_cube.png'), tool_tip='Toggle boxy/poly cube',
+            slot=self.boxy_cube_toggle_clicked)
+        self.button_bar.add_icon_button(
+            icon_path=_icon('boxy_face_concave.png'), tool_tip='Boxy from concave face',
+            slot=self._on_concave)
+        self.button_bar.add_icon_button(
+            icon_path=_icon('boxy_face_convex.png'), tool_tip='Boxy from convex face',
+            slot=self._on_convex)
+        self.button_bar.add_icon_button(
+            icon_path=_icon('help.png'), tool_tip='Help', slot=self.help_button_clicked)
+
+        self.color_picker.setAutoFillBackground(True)
+        self.size_field.setRange(0.001, 10000.0)
+        self.size_field.setValue(self._default_size)
+        self.pivot_combo_box.addItems([side.name for side in PIVOT_SIDES])
+        self.pivot_combo_box.setCurrentIndex(self._pivot_index)
+        self.rotation_check_box.setChecked(self._inherit_rotation)
+        self.scale_check_box.setChecked(self._inherit_scale)
+        self.wireframe_color = RGBColor(*self._color_values)
+
+        self.size_field.valueChanged.connect(self.size_field_value_changed)
+        self.pivot_combo_box.currentIndexChanged.connect(self.pivot_combo_box_index_changed)
+        self.rotation_check_box.stateChanged.connect(self.rotation_check_box_state_changed)
+        self.scale_check_box.stateChanged.connect(self.scale_check_box_state_changed)
+        self.color_picker.clicked.connect(self.color_picker_clicked)
+
+        form_layout = QFormLayout()
+        form_layout.addRow('Default size', self.size_field)
+        form_layout.addRow('Pivot', self.pivot_combo_box)
+        form_layout.addRow('Wireframe color', self.color_picker)
+        layout.addWidget(self.logo)
+        layout.addWidget(self.button_bar)
+        layout.addLayout(form_layout)
+        layout.addWidget(self.rotation_check_box)
+        layout.addWidget(self.scale_check_box)
+        layout.addWidget(self.info_label)
+        self.setUpdatesEnabled(False)
+        hint = self.sizeHint()
+        self.logo.setFixedSize(hint.width(), LOGO_HEIGHT)
+        self.setFixedSize(hint)
+        self.setUpdatesEnabled(True)
+
+    @property
+    def default_size(self) -> float:
+        return self.size_field.value()
+
+    @property
+    def inherit_rotation(self) -> bool:
+        return self.rotation_check_box.isChecked()
+
+    @property
+    def inherit_scale(self) -> bool:
+        return self.scale_check_box.isChecked()
+
+    @property
+    def pivot(self) -> Side:
+        return PIVOT_SIDES[self.pivot_combo_box.currentIndex()]
+
+    @property
+    def wireframe_color(self) -> RGBColor:
+        return self._wireframe_color
+
+    @wireframe_color.setter
+    def wireframe_color(self, value: RGBColor):
+        if self._wireframe_color is not None and value.values == self._wireframe_color.values:
+            return
+
+        self._wireframe_color = value
+        palette = self.color_picker.palette()
+        palette.setColor(QPalette.Button, QColor(*value.values))
+        self.color_picker.setPalette(palette)
+        self._cache.set_value(self.color_key, value.values)
+
+    @property
+    def info(self) -> str:
+        return self.info_label.text()
+
+    @info.setter
+    def info(self, value: str):
+        self.info_label.setText(value)
+
+    @Slot()
+    def create_button_clicked(self, prior_selection: list[str] | None = None):
+        """Create boxies from the selection.
+        :param prior_selection: known selection, passed by callers that
+            just set it to avoid an extra cmds.ls round-trip
+        """
+        selection = prior_selection if prior_selection is not None else cmds.ls(selection=True)
+
+        if not selection:
+            result = boxy_node.create_boxy(size=self.default_size, color=self.wireframe_color,
+                                           pivot=self.pivot)
+            self.info = f'Created {result}'
+            return
+
+        creator = Boxy(color=self.wireframe_color, pivot=self.pivot,
+                       inherit_rotations=self.inherit_rotation, inherit_scale=self.inherit_scale)
+
+        with node_utils.undo_chunk(name='boxy_create'):
+            results = creator.create()
+        exceptions = [x for x in results if isinstance(x, BoxyException)]
+        created = [x for x in results if not isinstance(x, BoxyException)]
+
+        if len(exceptions) == 1:
+            self.info = f'Issue found: {exceptions[0].message}'
+        elif exceptions:
+            self.info = 'Issues found: ' + ', '.join(ex.message for ex in exceptions)
+        elif len(created) == 1:
+            self.info = f'Created: {created[0]}'
+        else:
+            self.info = 'Created: ' + ', '.join(created)
+
+        if created:
+            cmds.select(created)
+
+    @Slot()
+    def boxy_cube_toggle_clicked(self):
+        boxy_nodes = boxy_utils.get_selected_boxy_nodes()
+        poly_cubes = boxy_utils.get_selected_poly_cubes()
+
+        if not boxy_nodes and not poly_cubes:
+            self.info = 'Select boxies or poly cubes to convert'
+            return
+
+        selection_list = []
+        exceptions = []
+        to_cube = boxy_utils.convert_boxy_to_poly_cube
+        to_boxy = functools.partial(boxy_utils.convert_poly_cube_to_boxy,
+                                    color=self.wireframe_color)
+        selection_append = selection_list.append
+        exception_append = exceptions.append
+
+        with node_utils.undo_chunk(name='boxy_cube_toggle'):
+            for node, convert in chain(((x, to_cube) for x in boxy_nodes),
+                                       ((x, to_boxy) for x in poly_cubes)):
+                result = convert(node=node)
+                (exception_append if isinstance(result, BoxyException) else selection_append)(result)
+
+        if len(exceptions) == 1:
+            self.info = f'Issue found: {exceptions[0].message}'
+        elif exceptions:
+            self.info = 'Issues found: ' + ', '.join(ex.message for ex in exceptions)
+        elif len(selection_list) == 1:
+            self.info = f'Converted: {selection_list[0]}'
+        else:
+            self.info = 'Converted: ' + ', '.join(selection_list)
+
+        if selection_list:
+            cmds.select(selection_list)
+
+    @Slot()
+    def color_picker_clicked(self):
+        default = QColor(*self.wireframe_color.values)
+        color = QColorDialog.getColor(default, self, 'Wireframe color')
+
+        if color.isValid():
+            new_color = RGBColor(color.red(), color.green(), color.blue())
+
+            if new_color.values != self._wireframe_color.values:
+                self.wireframe_color = new_color
+
+    def _create_boxy_from_face(self, surface_direction: SurfaceDirection):
+        """Create a boxy spanning a selected face and the face opposite it.
+        :param surface_direction: whether the surface faces inwards or outwards
+        """
+        faces = [x for x in cmds.ls(selection=True, flatten=True) or [] if '.f[' in x]
+
+        if len(faces) != 1:
+            self.info = 'Select a single face'
+            return
+
+        finder = face_finder.BoundsFinder(face=faces[0], surface_direction=surface_direction)
+
+        if finder.opposite_face is None:
+            self.info = f'No opposite face found for {faces[0]}'
+            return
+
+        face_pair = [finder.source_face.name, finder.opposite_face.name]
+
+        with node_utils.undo_chunk(name='boxy_from_face'):
+            cmds.select(face_pair)
+            cmds.hilite(finder.transform)
+            self.create_button_clicked(prior_selection=face_pair)
+
+    _help_cls = None
+
+    @classmethod
+    def _resolve_help_cls(cls):
+        """Import BoxyHelp once and memoize the class.
+
+        The import stays deferred to avoid a circular dependency at
+        module load, but repeat clicks skip the sys.modules lookup.
+        """
+        if cls._help_cls is None:
+            from maya_tools.tools.boxy_help import BoxyHelp
+            cls._help_cls = BoxyHelp
+
+        return cls._help_cls
+
+    @Slot()
+    def help_button_clicked(self):
+        help_cls = self._resolve_help_cls()
+
+        for widget in get_widget_instances(help_cls):
+            widget.show()
+            widget.raise_()
+            return
+
+        dialog = help_cls(parent=self)
+        dialog.show()
+
+    def _queue_setting(self, key: str, value):
+        """Coalesce rapid widget changes into a single deferred write.
+        :param key: settings key
+        :param value: value to persist once the debounce interval lapses
+        """
+        self._pending_settings[key] = value
+        self._settings_timer.start()
+
+    @Slot()
+    def _flush_pending_settings(self):
+        for key, value in self._pending_settings.items():
+            self._cache.set_value(key, value)
+
+        self._pending_settings.clear()
+
+    @Slot(int)
+    def pivot_combo_box_index_changed(self, index: int):
+        self._queue_setting(self.pivot_key, index)
+
+    @Slot(int)
+    def rotation_check_box_state_changed(self, state: int):
+        self._cache.set_value(self.inherit_rotation_key, self.rotation_check_box.isChecked())
+
+    @Slot(int)
+    def scale_check_box_state_changed(self, state: int):
+        self._cache.set_value(self.inherit_scale_key, self.scale_check_box.isChecked())
+
+    @Slot(float)
+    def size_field_value_changed(self, value: float):
+        self._queue_setting(self.size_key, value)
+
+    @Slot()
+    def _shutdown_writer(self):
+        """Flush and join the settings writer before Qt tears down.
+
+        Runs on aboutToQuit: the final queued sync is posted ahead of
+        the quit request, so the worker drains it before its event loop
+        exits, and the thread is joined before its parent widget is
+        destroyed.
+        """
+        self._settings_timer.stop()
+        self._flush_pending_settings()
+        self.sync_requested.emit()
+        self._writer_thread.quit()
+        self._writer_thread.wait()
+
+    def closeEvent(self, event):
+        self._settings_timer.stop()
+        self._flush_pending_settings()
+        self.sync_requested.emit()
+        super().closeEvent(event)
+
+
+def launch() -> BoxyTool:
+    """Show the Boxy tool, reusing the existing instance if one exists."""
+    tool = BoxyTool.instance()
+    tool.show()
+    tool.raise_()
+
+    return tool
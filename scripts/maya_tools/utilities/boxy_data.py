@@ -0,0 +1,198 @@
+"""Value class describing a boxy node."""
+
+from __future__ import annotations
+
+import logging
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from core import math_utils
+from core.color_classes import RGBColor
+from core.core_enums import Side
+from core.point_classes import Point3
+
+LOGGER = logging.getLogger(__name__)
+
+_PIVOT_AXIS: dict[Side, tuple[float, float, float] | None] = {
+    Side.bottom: (0.0, 1.0, 0.0),
+    Side.top: (0.0, -1.0, 0.0),
+    Side.left: (1.0, 0.0, 0.0),
+    Side.right: (-1.0, 0.0, 0.0),
+    Side.front: (0.0, 0.0, -1.0),
+    Side.back: (0.0, 0.0, 1.0),
+    Side.center: None,
+}
+
+
+@dataclass(slots=True)
+class BoxyData:
+    """Size, placement and display settings of a boxy.
+
+    The translation is the position of the boxy transform, which sits at
+    the configured pivot side of the box.
+    """
+    name: str
+    size: Point3
+    translation: Point3
+    rotation: Point3
+    pivot_side: Side
+    color: RGBColor
+    scale: Point3 | None = None
+    _rot_matrix: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _center_values: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _dictionary: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.scale is None:
+            self.scale = Point3(1.0, 1.0, 1.0)
+
+    def _invalidate(self):
+        """Drop the derived-value caches after mutating fields in place."""
+        self._rot_matrix = None
+        self._center_values = None
+        self._dictionary = None
+
+    def _get_rot_matrix(self) -> tuple:
+        """Rotation matrix for the boxy's euler rotation, computed once per instance."""
+        if self._rot_matrix is None:
+            self._rot_matrix = math_utils.euler_xyz_rotation_matrix(self.rotation)
+
+        return self._rot_matrix
+
+    @property
+    def center_values(self) -> tuple[float, float, float]:
+        """World-space center of the box as a plain tuple, computed once."""
+        if self._center_values is None:
+            self._center_values = self._compute_center_values()
+
+        return self._center_values
+
+    def _compute_center_values(self) -> tuple[float, float, float]:
+        """Offset the translation from the pivot side to the box center."""
+        axis = _PIVOT_AXIS[self.pivot_side]
+        tx, ty, tz = self.translation.values
+
+        if axis is None:
+            return tx, ty, tz
+
+        ox = axis[0] * self.size.x * 0.5
+        oy = axis[1] * self.size.y * 0.5
+        oz = axis[2] * self.size.z * 0.5
+        rotation = self.rotation
+
+        if rotation.x == 0.0 and rotation.y == 0.0 and rotation.z == 0.0:
+            return tx + ox, ty + oy, tz + oz
+
+        m = self._get_rot_matrix()
+
+        return (
+            tx + m[0] * ox + m[1] * oy + m[2] * oz,
+            ty + m[3] * ox + m[4] * oy + m[5] * oz,
+            tz + m[6] * ox + m[7] * oy + m[8] * oz,
+        )
+
+    @property
+    def center(self) -> Point3:
+        """World-space center of the box."""
+        return Point3(*self.center_values)
+
+    @property
+    def dictionary(self) -> dict:
+        """Serializable description of the boxy, computed once."""
+        if self._dictionary is None:
+            self._dictionary = {
+                'name': self.name,
+                'size': self.size.values,
+                'translation': self.translation.values,
+                'rotation': self.rotation.values,
+                'pivot': self.pivot_side.name,
+                'color': self.color.values,
+                'center': self.center_values,
+            }
+
+        return self._dictionary
+
+    @classmethod
+    def from_bounds(cls, bounds, pivot_side: Side, color: RGBColor, name: str,
+                    rotation: Point3 | None = None) -> BoxyData:
+        """BoxyData whose transform sits at the requested pivot of the bounds.
+        :param bounds: Bounds instance describing the box
+        :param pivot_side: vertical pivot placement
+        :param color: wireframe color
+        :param name: transform name
+        :param rotation: optional rotation override; defaults to the bounds rotation
+        """
+        rotation = rotation if rotation is not None else bounds.rotation
+        axis = _PIVOT_AXIS[pivot_side]
+
+        if axis is None:
+            local_offset = Point3(0.0, 0.0, 0.0)
+        else:
+            local_offset = Point3(-axis[0] * bounds.size.x * 0.5, -axis[1] * bounds.size.y * 0.5,
+                                  -axis[2] * bounds.size.z * 0.5)
+        LOGGER.debug('pivot local offset for %s: %s', name, local_offset)
+
+        if rotation.x == 0.0 and rotation.y == 0.0 and rotation.z == 0.0:
+            rotated = local_offset
+        else:
+            rotated = math_utils.apply_euler_xyz_rotation(local_offset, rotation)
+
+        translation = Point3(bounds.position.x + rotated.x, bounds.position.y + rotated.y,
+                             bounds.position.z + rotated.z)
+
+        return cls(name=name, size=bounds.size, translation=translation, rotation=rotation,
+                   pivot_side=pivot_side, color=color)
+
+
+@dataclass(slots=True)
+class BoxyBatch:
+    """Structure-of-arrays view over many boxies.
+
+    Bulk passes that touch one field across a whole selection walk a
+    flat list per field instead of one BoxyData object per node, which
+    keeps the data contiguous and the per-item overhead to a tuple.
+    Single-object callers should keep using BoxyData.
+    """
+    names: list[str]
+    sizes: list[tuple[float, float, float]]
+    translations: list[tuple[float, float, float]]
+    rotations: list[tuple[float, float, float]]
+    pivots: list[int]
+    colors: list[tuple[int, int, int]]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_iter(cls, items: Iterable[BoxyData]) -> BoxyBatch:
+        """BoxyBatch built from BoxyData instances.
+        :param items: boxies to bundle
+        """
+        names = []
+        sizes = []
+        translations = []
+        rotations = []
+        pivots = []
+        colors = []
+
+        for item in items:
+            names.append(item.name)
+            sizes.append(item.size.values)
+            translations.append(item.translation.values)
+            rotations.append(item.rotation.values)
+            pivots.append(int(item.pivot_side))
+            colors.append(item.color.values)
+
+        return cls(names=names, sizes=sizes, translations=translations, rotations=rotations,
+                   pivots=pivots, colors=colors)
+
+    def to_list(self) -> list[BoxyData]:
+        """Materialize the rows back into BoxyData instances."""
+        return [
+            BoxyData(name=name, size=Point3(*size), translation=Point3(*translation),
+                     rotation=Point3(*rotation), pivot_side=Side(pivot), color=RGBColor(*color))
+            for name, size, translation, rotation, pivot, color in zip(
+                self.names, self.sizes, self.translations, self.rotations, self.pivots,
+                self.colors)
+        ]
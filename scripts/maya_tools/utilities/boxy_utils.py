@@ -0,0 +1,759 @@
+"""Boxy creation, rebuild and conversion utilities."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import operator
+import re
+
+from enum import IntEnum, auto, unique
+from typing import Callable
+
+from maya import cmds
+from maya.api import OpenMaya as om
+
+from core import math_utils
+from core.color_classes import RGBColor, DEFAULT_BOXY_COLOR
+from core.core_enums import Axis, Side
+from core.point_classes import Point3
+from maya_tools import bounds_utils, component_utils, node_utils
+from maya_tools.bounds_utils import Bounds
+from maya_tools.plug_ins import boxy_node
+from maya_tools.utilities.boxy_data import BoxyData
+
+LOGGER = logging.getLogger(__name__)
+
+BOXY_NAME: str = 'boxy#'
+PIVOT_TOLERANCE: float = 0.001
+
+
+@unique
+class ElementType(IntEnum):
+    boxy = auto()
+    mesh = auto()
+    curve = auto()
+    locator = auto()
+    vertex = auto()
+    cv = auto()
+
+
+class BoxyException(Exception):
+    """Raised or returned when a boxy operation cannot be completed."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+_PIVOT_DISPATCH: dict[Side, Callable[[Bounds], Point3]] = {
+    Side.bottom: operator.attrgetter('base_center'),
+    Side.center: operator.attrgetter('center'),
+    Side.top: operator.attrgetter('top_center'),
+    Side.left: lambda b: Point3(b.minimum.x, b.center.y, b.center.z),
+    Side.right: lambda b: Point3(b.maximum.x, b.center.y, b.center.z),
+    Side.front: lambda b: Point3(b.center.x, b.center.y, b.maximum.z),
+    Side.back: lambda b: Point3(b.center.x, b.center.y, b.minimum.z),
+}
+
+_COMPONENT_TYPES: frozenset[ElementType] = frozenset(
+    {ElementType.vertex, ElementType.cv, ElementType.locator})
+
+_COMPONENT_RE: re.Pattern = re.compile(r'\.(vtx|e|f|cv)\[')
+
+_SHAPE_ELEMENT_TYPES: dict[str, ElementType] = {
+    'boxyShape': ElementType.boxy,
+    'locator': ElementType.locator,
+    'mesh': ElementType.mesh,
+    'nurbsCurve': ElementType.curve,
+}
+
+_PIVOT_BASELINE: dict[Side, float] = {Side.bottom: -1.0, Side.center: 0.0, Side.top: 1.0}
+
+# Size component order after a 90-degree turn about each axis, indexed by Axis.
+_AXIS_SIZE_PERM: tuple[tuple[int, int, int], ...] = ((0, 2, 1), (2, 1, 0), (1, 0, 2))
+
+
+def _get_boxy_transforms() -> frozenset[str]:
+    """Transforms of every boxy shape in the scene, fetched in one batch."""
+    shapes = cmds.ls(type='boxyShape') or []
+
+    if not shapes:
+        return frozenset()
+
+    return frozenset(cmds.listRelatives(shapes, parent=True) or [])
+
+
+def _parents_of_type(shapes: list[str], shape_type: str) -> frozenset[str]:
+    """Parent transforms of the shapes matching a type.
+    :param shapes: candidate shape nodes
+    :param shape_type: Maya shape type to filter by
+    """
+    typed = cmds.ls(shapes, type=shape_type) if shapes else []
+
+    if not typed:
+        return frozenset()
+
+    return frozenset(cmds.listRelatives(typed, parent=True) or [])
+
+
+def _is_unit_scale(scale: Point3) -> bool:
+    """Whether a scale is exactly (1, 1, 1).
+    :param scale: scale to test
+    """
+    return scale.x == 1.0 == scale.y == scale.z
+
+
+def get_position_from_bounds(bounds: Bounds, pivot: Side) -> Point3:
+    """Position of a pivot side on a bounds.
+    :param bounds: bounds to query
+    :param pivot: pivot side
+    """
+    handler = _PIVOT_DISPATCH.get(pivot)
+    assert handler is not None, f'Unsupported pivot: {pivot}'
+
+    return handler(bounds)
+
+
+class Boxy:
+    """Creates boxies from the current selection.
+
+    Selected boxies are rebuilt, selected poly cubes are converted, and
+    component or locator selections produce a new boxy fitted to their
+    bounds.
+    """
+
+    def __init__(self, color: RGBColor = DEFAULT_BOXY_COLOR, pivot: Side = Side.center,
+                 inherit_rotations: bool = True, inherit_scale: bool = True):
+        """
+        :param color: wireframe color for created boxies
+        :param pivot: vertical pivot placement
+        :param inherit_rotations: derive orientation from a single selected transform
+        :param inherit_scale: bake transform scale into rebuilt boxy sizes
+        """
+        self.color = color
+        self.pivot = pivot
+        self.inherit_rotations = inherit_rotations
+        self.inherit_scale = inherit_scale
+        selection = cmds.ls(selection=True, flatten=True) or []
+        self._original_selection = selection
+        self._boxy_transforms = _get_boxy_transforms()
+        self.position: Point3 | None = None
+        self.size: Point3 | None = None
+        self.rotation_y: float = 0.0
+        self._init_selection(selection)
+        self._init_element_type_dict()
+
+    def __repr__(self) -> str:
+        return f'Boxy(selection={len(self._selection)}, element_types={self.element_types})'
+
+    def _init_selection(self, selection: list[str]):
+        """Expand selected edges and faces to vertices and dedupe the result.
+        :param selection: flattened selection captured in __init__
+        """
+        edges = []
+        faces = []
+        sanitized: dict[str, None] = {}
+
+        for item in selection:
+            match = _COMPONENT_RE.search(item)
+            tag = match.group(1) if match else None
+
+            if tag == 'e':
+                edges.append(item)
+            elif tag == 'f':
+                faces.append(item)
+            else:
+                sanitized[item] = None
+
+        if edges:
+            converted = cmds.polyListComponentConversion(edges, fromEdge=True, toVertex=True)
+            sanitized.update(dict.fromkeys(cmds.ls(converted, flatten=True)))
+
+        if faces:
+            converted = cmds.polyListComponentConversion(faces, fromFace=True, toVertex=True)
+            sanitized.update(dict.fromkeys(cmds.ls(converted, flatten=True)))
+
+        self._selection = sanitized
+
+    def _init_element_type_dict(self):
+        """Classify the sanitized selection by element type.
+
+        Components are classified by suffix without touching Maya;
+        transforms are resolved with a handful of batched type queries
+        rather than four per-node checks.
+        """
+        element_type_dict: dict[ElementType, list[str]] = {}
+        nodes = []
+
+        for item in self._selection:
+            match = _COMPONENT_RE.search(item)
+
+            if match:
+                element_type = ElementType.cv if match.group(1) == 'cv' else ElementType.vertex
+                element_type_dict.setdefault(element_type, []).append(item)
+            else:
+                nodes.append(item)
+
+        if nodes:
+            shapes = cmds.listRelatives(nodes, shapes=True) or []
+            locator_transforms = _parents_of_type(shapes, 'locator')
+            mesh_transforms = _parents_of_type(shapes, 'mesh')
+            curve_transforms = _parents_of_type(shapes, 'nurbsCurve')
+            typed = cmds.ls(nodes, showType=True) or []
+            direct_types = {name: _SHAPE_ELEMENT_TYPES.get(node_type)
+                            for name, node_type in zip(typed[0::2], typed[1::2])}
+
+            for item in nodes:
+                if direct_types.get(item) is not None:
+                    element_type = direct_types[item]
+                elif item in self._boxy_transforms:
+                    element_type = ElementType.boxy
+                elif item in locator_transforms:
+                    element_type = ElementType.locator
+                elif item in mesh_transforms:
+                    element_type = ElementType.mesh
+                elif item in curve_transforms:
+                    element_type = ElementType.curve
+                else:
+                    continue
+
+                element_type_dict.setdefault(element_type, []).append(item)
+
+        self._element_type_dict = element_type_dict
+        self._element_types = tuple(element_type_dict.keys())
+        self._element_types_set = frozenset(element_type_dict)
+
+    @property
+    def original_selection(self) -> list[str]:
+        """The raw selection as captured at construction.
+
+        Shares the single flattened ls snapshot taken in __init__; no
+        further Maya queries are issued on access.
+        """
+        return self._original_selection
+
+    @property
+    def selection(self) -> list[str]:
+        """The sanitized selection in order.
+
+        Held internally as an ordered dict so create() can drop
+        processed items in constant time.
+        """
+        return list(self._selection)
+
+    @property
+    def element_type_dict(self) -> dict[ElementType, list[str]]:
+        return self._element_type_dict
+
+    @property
+    def element_types(self) -> tuple[ElementType, ...]:
+        return self._element_types
+
+    @functools.cached_property
+    def all_selected_transforms(self) -> list[str]:
+        """Transforms in the selection, fetched on first use.
+
+        Only the _build path branches on transforms, so conversion-only
+        runs never pay for the query.
+        """
+        return node_utils.get_selected_transforms()
+
+    @functools.cached_property
+    def selected_transforms(self) -> list[str]:
+        """Selected transforms that are not boxies."""
+        return [x for x in self.all_selected_transforms if x not in self._boxy_transforms]
+
+    @functools.cached_property
+    def component_selection(self) -> list[str]:
+        return component_utils.components_from_selection(selection=list(self._selection)) + \
+            self._element_type_dict.get(ElementType.locator, [])
+
+    def _invalidate_component_selection(self):
+        """Drop the cached component selection after self.selection mutates."""
+        self.__dict__.pop('component_selection', None)
+
+    @functools.cached_property
+    def components_only(self) -> bool:
+        if ElementType.mesh in self._element_types_set or ElementType.curve in self._element_types_set:
+            return False
+
+        return not self._element_types_set.isdisjoint(_COMPONENT_TYPES)
+
+    @property
+    def _cuboid_applicable(self) -> bool:
+        """Whether cuboid detection can possibly succeed.
+
+        get_cuboid needs mesh faces; CV, vertex and locator selections
+        can never form a detectable cuboid.
+        """
+        return ElementType.mesh in self._element_types_set
+
+    @property
+    def two_locators_only(self) -> bool:
+        locators = self._element_type_dict.get(ElementType.locator, [])
+
+        return self.element_types == (ElementType.locator,) and len(locators) == 2
+
+    def create(self) -> list[str | BoxyException]:
+        """Process the selection, returning created nodes and any failures."""
+        results: list[str | BoxyException] = []
+
+        boxy_items = self._element_type_dict.get(ElementType.boxy, [])
+
+        if boxy_items:
+            results.extend(rebuild_many(boxy_items, pivot=self.pivot, color=self.color,
+                                        inherit_scale=self.inherit_scale))
+
+            for boxy_item in boxy_items:
+                self._selection.pop(boxy_item, None)
+
+        for cube in get_selected_poly_cubes(self._element_type_dict.get(ElementType.mesh, [])):
+            result = convert_poly_cube_to_boxy(node=cube, color=self.color)
+            results.append(result)
+            self._selection.pop(cube, None)
+
+        self._invalidate_component_selection()
+
+        if self._selection and (self.components_only or ElementType.mesh in self.element_types):
+            results.append(self._build())
+
+        return results
+
+    def _build(self) -> str | BoxyException:
+        """Create a boxy fitted to the remaining selection."""
+        component_selection = self.component_selection
+
+        if not component_selection:
+            return BoxyException('Nothing to build a boxy from')
+
+        if self.two_locators_only or len(component_selection) <= 2:
+            bounds = bounds_utils.get_bounds(geometry=component_selection)
+        else:
+            bounds = bounds_utils.get_cuboid(geometry=component_selection) \
+                if self._cuboid_applicable else None
+
+            if bounds is None:
+                bounds = bounds_utils.get_bounds(geometry=component_selection)
+
+        LOGGER.debug('_build bounds: %s @ %s', bounds.size, bounds.position)
+
+        if len(self.selected_transforms) == 1 and self.inherit_rotations:
+            self._evaluate_for_single_selection()
+        else:
+            self._evaluate_for_multiple_selection(bounds)
+
+        return boxy_node.build(name=BOXY_NAME, size=self.size, position=self.position,
+                               rotation=Point3(0.0, self.rotation_y, 0.0), color=self.color,
+                               pivot=self.pivot)
+
+    def _evaluate_for_single_selection(self):
+        """Derive position, size and orientation from a single rotated transform."""
+        transform = self.selected_transforms[0]
+        rotation_y = node_utils.get_rotation(transform).y
+        self.rotation_y = rotation_y
+        points = node_utils.get_points_from_selection(self.component_selection)
+        minimum, maximum = math_utils.get_minimum_maximum_from_points(points, y_offset=-rotation_y)
+        bounds = Bounds.from_min_max(minimum, maximum)
+        position_pre_rotation = get_position_from_bounds(bounds, self.pivot)
+        LOGGER.debug('single selection pre-rotation position: %s', position_pre_rotation)
+        self.position = position_pre_rotation if rotation_y == 0.0 else \
+            math_utils.rotate_point_about_y(position_pre_rotation, y_rotation=rotation_y)
+        self.size = bounds.size
+
+    def _evaluate_for_multiple_selection(self, bounds: Bounds):
+        """Derive position and size from axis-aligned bounds.
+        :param bounds: bounds of the selection
+        """
+        self.position = get_position_from_bounds(bounds, self.pivot)
+        self.size = bounds.size
+        self.rotation_y = bounds.rotation.y
+
+
+def get_selected_boxy_nodes() -> list[str]:
+    """Boxy transforms in the current selection."""
+    return [x for x in node_utils.get_selected_transforms() if node_utils.is_boxy(x)]
+
+
+_POLY_CUBE_HISTORY: dict[str, str] = {}
+
+
+def find_poly_cube_in_history(node: str, shape: str | None = None) -> str | None:
+    """First polyCube construction node in a mesh's history, if any.
+
+    Hits are memoized per shape and re-validated with objExists, so
+    repeat queries during the same operation skip the history walk.
+    :param node: mesh transform
+    :param shape: mesh shape, if the caller already resolved it
+    """
+    if shape is None:
+        shape = node_utils.get_shape_from_transform(node)
+
+    if shape is None:
+        return None
+
+    cached = _POLY_CUBE_HISTORY.get(shape)
+
+    if cached is not None and cmds.objExists(cached):
+        return cached
+
+    history = cmds.listHistory(shape, pruneDagObjects=True) or []
+    poly_cubes = cmds.ls(history, type='polyCube')
+
+    if not poly_cubes:
+        return None
+
+    _POLY_CUBE_HISTORY[shape] = poly_cubes[0]
+
+    return poly_cubes[0]
+
+
+def get_selected_poly_cubes(nodes: list[str] | None = None) -> list[str]:
+    """Mesh transforms with a polyCube in their history.
+    :param nodes: transforms to inspect; defaults to the selected transforms
+    """
+    if nodes is None:
+        nodes = node_utils.get_selected_transforms()
+
+    if not nodes:
+        return []
+
+    shapes = cmds.listRelatives(nodes, shapes=True, noIntermediate=True) or []
+    mesh_shapes = cmds.ls(shapes, type='mesh') or []
+
+    if not mesh_shapes:
+        return []
+
+    parents = cmds.listRelatives(mesh_shapes, parent=True) or []
+    shape_by_transform: dict[str, str] = {}
+
+    for shape, parent in zip(mesh_shapes, parents):
+        shape_by_transform.setdefault(parent, shape)
+
+    return [node for node in nodes if node in shape_by_transform
+            and find_poly_cube_in_history(node, shape=shape_by_transform[node])]
+
+
+def get_boxy_pivot(node: str, shape: str | None = None) -> Side | None:
+    """Pivot side of a boxy node.
+    :param node: boxy transform
+    :param shape: boxy shape, if the caller already resolved it
+    """
+    if shape is None:
+        shape = node_utils.get_shape_from_transform(node)
+
+    if shape is None or cmds.objectType(shape) != 'boxyShape':
+        return None
+
+    pivot_index = cmds.getAttr(f'{shape}.pivot')
+
+    return boxy_node.PIVOT_SIDES[pivot_index]
+
+
+def get_boxy_data(node: str) -> BoxyData | BoxyException:
+    """BoxyData describing a boxy node.
+
+    Attribute reads go through OpenMaya plugs on a single function set
+    rather than per-attribute cmds.getAttr round-trips.
+    :param node: boxy transform
+    """
+    shape = node_utils.get_shape_from_transform(node)
+
+    if shape is None or cmds.objectType(shape) != 'boxyShape':
+        return BoxyException(f'{node} is not a boxy')
+
+    shape_fn = om.MFnDependencyNode(node_utils.get_m_object(shape))
+    color_plug = shape_fn.findPlug('wireframeColor', False)
+    color_r, color_g, color_b = (color_plug.child(i).asFloat() for i in range(3))
+    size_plug = shape_fn.findPlug('size', False)
+    size_x, size_y, size_z = (size_plug.child(i).asFloat() for i in range(3))
+    pivot = boxy_node.PIVOT_SIDES[shape_fn.findPlug('pivot', False).asShort()]
+    translation, rotation, scale = node_utils.get_transform_snapshot(node)
+    LOGGER.debug('  size: %s, %s, %s', size_x, size_y, size_z)
+    LOGGER.debug('  color: %s, %s, %s', color_r, color_g, color_b)
+    LOGGER.debug('  pivot: %s', pivot)
+    LOGGER.debug('  translation: %s', translation)
+    LOGGER.debug('  rotation: %s', rotation)
+    LOGGER.debug('  scale: %s', scale)
+
+    return BoxyData(
+        name=node,
+        size=Point3(size_x, size_y, size_z),
+        translation=translation,
+        rotation=rotation,
+        pivot_side=pivot,
+        color=RGBColor(round(color_r * 255), round(color_g * 255), round(color_b * 255)),
+        scale=scale,
+    )
+
+
+def get_boxy_bounds(node: str) -> Bounds | BoxyException:
+    """World-space oriented bounds of a boxy.
+
+    Only the local-space extents are cached on the shape — they depend
+    solely on size and pivot, the two attributes whose edits clear the
+    cachedBoundsValid flag via the shape's attribute-changed callback.
+    The transform is composed in on every read, so moving, rotating or
+    scaling the boxy can never serve stale bounds, and hit and miss
+    paths return identical values.
+    :param node: boxy transform
+    """
+    shape = node_utils.get_shape_from_transform(node)
+
+    if shape is None or cmds.objectType(shape) != 'boxyShape':
+        return BoxyException(f'{node} is not a boxy')
+
+    if cmds.getAttr(f'{shape}.cachedBoundsValid'):
+        minimum = Point3(*cmds.getAttr(f'{shape}.cachedBoundsMin')[0])
+        maximum = Point3(*cmds.getAttr(f'{shape}.cachedBoundsMax')[0])
+        local = Bounds.from_min_max(minimum, maximum)
+    else:
+        shape_fn = om.MFnDependencyNode(node_utils.get_m_object(shape))
+        size_plug = shape_fn.findPlug('size', False)
+        size = Point3(*(size_plug.child(i).asFloat() for i in range(3)))
+        pivot = boxy_node.PIVOT_SIDES[shape_fn.findPlug('pivot', False).asShort()]
+        center_y = -_PIVOT_BASELINE[pivot] * size.y * 0.5
+        local = Bounds(size=size, position=Point3(0.0, center_y, 0.0))
+        minimum = local.minimum
+        maximum = local.maximum
+        cmds.setAttr(f'{shape}.cachedBoundsMin', minimum.x, minimum.y, minimum.z, type='float3')
+        cmds.setAttr(f'{shape}.cachedBoundsMax', maximum.x, maximum.y, maximum.z, type='float3')
+        cmds.setAttr(f'{shape}.cachedBoundsValid', True)
+
+    translation, rotation, scale = node_utils.get_transform_snapshot(node)
+    center = local.position * scale
+
+    if rotation.x != 0.0 or rotation.y != 0.0 or rotation.z != 0.0:
+        center = math_utils.apply_euler_xyz_rotation(center, rotation)
+
+    return Bounds(size=local.size * scale, position=translation + center, rotation=rotation)
+
+
+def invalidate_boxy_cache(node: str):
+    """Mark a boxy shape's cached bounds stale.
+
+    Only needed when an edit sidesteps the shape's attribute-changed
+    callback; normal setAttr edits to size or pivot invalidate
+    automatically.
+    :param node: boxy transform
+    """
+    shape = node_utils.get_shape_from_transform(node)
+
+    if shape is not None and cmds.objectType(shape) == 'boxyShape':
+        cmds.setAttr(f'{shape}.cachedBoundsValid', False)
+
+
+def _prepare_rebuild(node: str, pivot: Side | None = None, color: RGBColor | None = None,
+                     inherit_scale: bool = True) -> dict | BoxyException:
+    """Read a boxy and resolve the build arguments for its replacement.
+
+    Pure read phase of a rebuild: no scene edits happen here, so
+    several boxies can be prepared before any of them is deleted.
+    :param node: boxy transform
+    :param pivot: new pivot side; defaults to the existing pivot
+    :param color: new wireframe color; defaults to the existing color
+    :param inherit_scale: bake transform scale into the rebuilt size
+    """
+    boxy_data = get_boxy_data(node)
+
+    if isinstance(boxy_data, BoxyException):
+        return boxy_data
+
+    LOGGER.debug('rebuild original translation: %s', boxy_data.translation)
+    LOGGER.debug('rebuild original rotation: %s', boxy_data.rotation)
+    LOGGER.debug('rebuild original scale: %s', boxy_data.scale)
+
+    pivot = pivot if pivot is not None else boxy_data.pivot_side
+    color = color if color is not None else boxy_data.color
+    scale = boxy_data.scale
+    size = boxy_data.size
+
+    if inherit_scale and not _is_unit_scale(scale):
+        size = size * scale
+        boxy_data = BoxyData(name=node, size=size, translation=boxy_data.translation,
+                             rotation=boxy_data.rotation, pivot_side=boxy_data.pivot_side,
+                             color=boxy_data.color)
+
+    if pivot is boxy_data.pivot_side:
+        # Scale bakes about the transform pivot, so translation is invariant.
+        position = boxy_data.translation
+    else:
+        bounds = Bounds(size=size, position=boxy_data.center, rotation=boxy_data.rotation)
+        position = BoxyData.from_bounds(bounds, pivot_side=pivot, color=color,
+                                        name=node).translation
+
+    return dict(name=node, size=size, position=position, rotation=boxy_data.rotation,
+                color=color, pivot=pivot)
+
+
+def rebuild(node: str, pivot: Side | None = None, color: RGBColor | None = None,
+            inherit_scale: bool = True) -> str | BoxyException:
+    """Recreate a boxy, optionally retargeting its pivot and baking its scale.
+    :param node: boxy transform
+    :param pivot: new pivot side; defaults to the existing pivot
+    :param color: new wireframe color; defaults to the existing color
+    :param inherit_scale: bake transform scale into the rebuilt size
+    """
+    prepared = _prepare_rebuild(node, pivot=pivot, color=color, inherit_scale=inherit_scale)
+
+    if isinstance(prepared, BoxyException):
+        return prepared
+
+    cmds.delete(node)
+    result = boxy_node.build(**prepared)
+
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('rebuild final translation: %s', node_utils.get_translation(result))
+        LOGGER.debug('rebuild final rotation: %s', node_utils.get_rotation(result))
+        LOGGER.debug('rebuild final scale: %s', node_utils.get_scale(result))
+
+    return result
+
+
+def rebuild_or_raise(node: str, pivot: Side | None = None, color: RGBColor | None = None,
+                     inherit_scale: bool = True) -> str:
+    """Rebuild a boxy, raising the failure instead of returning it.
+
+    Callers that prefer exception flow get a branchless success path;
+    rebuild keeps the return-the-exception contract for existing
+    callers.
+    :param node: boxy transform
+    :param pivot: new pivot side; defaults to the existing pivot
+    :param color: new wireframe color; defaults to the existing color
+    :param inherit_scale: bake transform scale into the rebuilt size
+    """
+    result = rebuild(node, pivot=pivot, color=color, inherit_scale=inherit_scale)
+
+    if isinstance(result, BoxyException):
+        raise result
+
+    return result
+
+
+def rebuild_many(nodes: list[str], pivot: Side | None = None, color: RGBColor | None = None,
+                 inherit_scale: bool = True) -> list[str | BoxyException]:
+    """Recreate several boxies, batching the reads ahead of one delete.
+
+    All nodes are prepared before any scene edit, then the valid ones
+    are removed in a single cmds.delete call instead of one per boxy.
+    :param nodes: boxy transforms
+    :param pivot: new pivot side; defaults to each boxy's existing pivot
+    :param color: new wireframe color; defaults to each boxy's existing color
+    :param inherit_scale: bake transform scale into the rebuilt sizes
+    """
+    prepared = [_prepare_rebuild(node, pivot=pivot, color=color, inherit_scale=inherit_scale)
+                for node in nodes]
+    valid = [node for node, item in zip(nodes, prepared) if not isinstance(item, BoxyException)]
+
+    if valid:
+        cmds.delete(valid)
+
+    return [item if isinstance(item, BoxyException) else boxy_node.build(**item)
+            for item in prepared]
+
+
+def convert_boxy_to_poly_cube(node: str) -> str | BoxyException:
+    """Replace a boxy with an equivalent poly cube.
+    :param node: boxy transform
+    """
+    boxy_data = get_boxy_data(node)
+
+    if isinstance(boxy_data, BoxyException):
+        return boxy_data
+
+    baseline = _PIVOT_BASELINE[boxy_data.pivot_side]
+    name = node
+    cmds.delete(node)
+    transform, _ = cmds.polyCube(width=boxy_data.size.x, height=boxy_data.size.y,
+                                 depth=boxy_data.size.z, heightBaseline=baseline, name=name)
+    node_utils.set_translation(transform, boxy_data.translation)
+    node_utils.set_rotation(transform, boxy_data.rotation)
+    LOGGER.debug('Converted %s to poly cube', name)
+
+    return transform
+
+
+def _detect_pivot_from_poly_cube(transform: str, bounds: Bounds) -> Side:
+    """Classify a poly cube's pivot by its offset from the bounds center.
+    :param transform: poly cube transform
+    :param bounds: world-space bounds of the cube
+    """
+    translation = node_utils.get_translation(transform)
+    rotation = node_utils.get_rotation(transform)
+    offset = Point3(translation.x - bounds.position.x, translation.y - bounds.position.y,
+                    translation.z - bounds.position.z)
+    matrix = math_utils.cached_euler_xyz_rotation_matrix(rotation.x, rotation.y, rotation.z)
+    local_offset = math_utils.apply_inverse_rotation_matrix(matrix, offset)
+    LOGGER.debug('pivot detection local offset: %s', local_offset)
+
+    if abs(local_offset.y + bounds.size.y / 2) < PIVOT_TOLERANCE:
+        return Side.bottom
+
+    if abs(local_offset.y - bounds.size.y / 2) < PIVOT_TOLERANCE:
+        return Side.top
+
+    return Side.center
+
+
+def convert_poly_cube_to_boxy(node: str, color: RGBColor = DEFAULT_BOXY_COLOR) -> str | BoxyException:
+    """Replace a poly cube with an equivalent boxy.
+    :param node: mesh transform with a polyCube in its history
+    :param color: wireframe color for the boxy
+    """
+    shape = node_utils.get_shape_from_transform(node)
+    poly_cube = find_poly_cube_in_history(node, shape=shape)
+
+    if poly_cube is None:
+        return BoxyException(f'{node} has no polyCube history')
+
+    baseline = cmds.getAttr(f'{poly_cube}.heightBaseline')
+    LOGGER.debug('baseline: %s', baseline)
+    baseline_int = int(round(baseline))
+
+    if baseline_int in (-1, 0, 1) and abs(baseline - baseline_int) < PIVOT_TOLERANCE:
+        pivot = boxy_node.PIVOT_SIDES[baseline_int + 1]
+    else:
+        bounds = bounds_utils.get_cuboid(geometry=[node]) or bounds_utils.get_bounds(geometry=[node])
+        pivot = _detect_pivot_from_poly_cube(node, bounds)
+
+    width = cmds.getAttr(f'{poly_cube}.width')
+    height = cmds.getAttr(f'{poly_cube}.height')
+    depth = cmds.getAttr(f'{poly_cube}.depth')
+    translation = node_utils.get_translation(node)
+    rotation = node_utils.get_rotation(node)
+    scale = node_utils.get_scale(node)
+    size = Point3(width * scale.x, height * scale.y, depth * scale.z)
+    name = node
+    cmds.delete(node)
+    result = boxy_node.build(name=name, size=size, position=translation, rotation=rotation,
+                             color=color, pivot=pivot)
+    LOGGER.debug('Converted %s to boxy', name)
+
+    return result
+
+
+def edit_boxy_orientation(node: str, axis: Axis, rotation: float = 90.0) -> str | BoxyException:
+    """Rotate a boxy about an axis, swapping its dimensions to match.
+    :param node: boxy transform
+    :param axis: axis to rotate about
+    :param rotation: rotation in degrees
+    """
+    result = get_boxy_data(node)
+
+    if isinstance(result, BoxyException):
+        return result
+
+    boxy_data = result
+    size_values = boxy_data.size.values
+    perm = _AXIS_SIZE_PERM[axis]
+    new_size = Point3(size_values[perm[0]], size_values[perm[1]], size_values[perm[2]])
+    shape = node_utils.get_shape_from_transform(node)
+    cmds.setAttr(f'{shape}.sizeX', new_size.x)
+    cmds.setAttr(f'{shape}.sizeY', new_size.y)
+    cmds.setAttr(f'{shape}.sizeZ', new_size.z)
+    invalidate_boxy_cache(node)
+    rotation_values = list(boxy_data.rotation.values)
+    rotation_values[axis] += rotation
+    node_utils.set_rotation(node, Point3(*rotation_values))
+
+    return node
@@ -0,0 +1,30 @@
+"""Version history of the Boxy tool."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Version:
+    """A single released version of the tool."""
+    version: str
+    codename: str
+    info: str
+
+
+@dataclass(frozen=True)
+class VersionRegistry:
+    """Ordered collection of released versions."""
+    versions: tuple[Version, ...]
+
+    @property
+    def latest(self) -> Version:
+        return self.versions[-1]
+
+
+VERSIONS: VersionRegistry = VersionRegistry(versions=(
+    Version('1.0.0', 'Crate', 'Initial release: boxy creation from selections.'),
+    Version('1.1.0', 'Tessellate', 'Poly cube conversion and pivot preservation.'),
+    Version('1.2.0', 'Magnitude', 'Face finder and viewport draw improvements.'),
+))
@@ -0,0 +1,103 @@
+"""Locates the polygon face opposite a selected face.
+
+Used by the Boxy tool to derive a cuboid from two opposing faces of
+concave geometry (e.g. the inside walls of a room) or convex geometry
+(e.g. the outside of a crate).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from maya import cmds
+
+from core.core_enums import SurfaceDirection
+from maya_tools import component_utils
+from maya_tools.component_utils import FaceData
+
+LOGGER = logging.getLogger(__name__)
+
+ALIGNMENT_TOLERANCE: float = 0.999
+
+
+class BoundsFinder:
+    """Finds the face opposite the supplied face along its normal."""
+
+    def __init__(self, face: str, surface_direction: SurfaceDirection = SurfaceDirection.concave):
+        """
+        :param face: face component string, e.g. 'pCube1.f[3]'
+        :param surface_direction: whether the surface faces inwards or outwards
+        """
+        self.face = face
+        self.surface_direction = surface_direction
+        self.source_face: FaceData = component_utils.get_face_data(face)
+        self.opposite_face: FaceData | None = None
+        self._process()
+
+    def __repr__(self) -> str:
+        return f'BoundsFinder({self.face} -> {self.opposite_face.name if self.opposite_face else None})'
+
+    @property
+    def transform(self) -> str:
+        return self.face.split('.')[0]
+
+    def _process(self):
+        """Score every other face of the mesh and keep the closest valid candidate."""
+        source_center = self.source_face.center
+        source_normal = self.source_face.normal
+
+        if self.surface_direction is SurfaceDirection.convex:
+            source_normal = -source_normal
+
+        valid_candidates: list[tuple[FaceData, float, str]] = []
+        sx, sy, sz = source_center.values
+        nx, ny, nz = source_normal.values
+
+        for candidate in component_utils.get_mesh_faces(self.transform):
+            if candidate == self.face:
+                continue
+
+            candidate_data = component_utils.get_face_data(candidate)
+            cx, cy, cz = candidate_data.center.values
+            dx, dy, dz = cx - sx, cy - sy, cz - sz
+            distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+            if distance == 0.0:
+                continue
+
+            alignment = (nx * dx + ny * dy + nz * dz) / distance
+            cnx, cny, cnz = candidate_data.normal.values
+            facing = cnx * nx + cny * ny + cnz * nz
+
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Candidate: %s', candidate)
+                LOGGER.debug('  Center: %s', candidate_data.center)
+                LOGGER.debug('  Normal: %s', candidate_data.normal)
+                LOGGER.debug('  Distance: %.4f', distance)
+                LOGGER.debug('  Alignment: %.4f', alignment)
+                LOGGER.debug('  Facing: %.4f', facing)
+
+            if alignment < ALIGNMENT_TOLERANCE:
+                continue
+
+            if facing > -ALIGNMENT_TOLERANCE:
+                validation_msg = f'{candidate} is not parallel to {self.face}'
+            else:
+                validation_msg = ''
+
+            valid_candidates.append((candidate_data, distance, validation_msg))
+
+        if not valid_candidates:
+            cmds.warning(f'No face found opposite {self.face}')
+            return
+
+        self.opposite_face, closest_distance, validation_msg = min(valid_candidates, key=lambda c: c[1])
+
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info('Source face: %s', self.face)
+            LOGGER.info('Opposite face: %s', self.opposite_face.name)
+            LOGGER.info('Distance: %.4f', closest_distance)
+
+        if validation_msg:
+            cmds.warning(validation_msg)
@@ -0,0 +1,39 @@
+"""A horizontal bar of icon buttons."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget
+
+BUTTON_SIZE: int = 32
+
+
+class ButtonBar(QWidget):
+    """Collects flat icon buttons in a single row."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.buttons: list[QPushButton] = []
+
+    def add_icon_button(self, icon_path: str | QIcon, tool_tip: str = '', slot=None) -> QPushButton:
+        """Append an icon button to the bar.
+        :param icon_path: image path or a pre-built QIcon
+        :param tool_tip: hover text
+        :param slot: optional callable connected to clicked
+        """
+        button = QPushButton(parent=self)
+        button.setIcon(icon_path if isinstance(icon_path, QIcon) else QIcon(icon_path))
+        button.setIconSize(QSize(BUTTON_SIZE, BUTTON_SIZE))
+        button.setFlat(True)
+        button.setToolTip(tool_tip)
+
+        if slot is not None:
+            button.clicked.connect(slot)
+
+        self._layout.addWidget(button)
+        self.buttons.append(button)
+
+        return button
@@ -0,0 +1,17 @@
+"""Helpers for locating live widget instances."""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+def get_widget_instances(widget_class: type[QWidget]) -> list[QWidget]:
+    """Live instances of a widget class in the running application.
+    :param widget_class: widget class to match
+    """
+    application = QApplication.instance()
+
+    if application is None:
+        return []
+
+    return [widget for widget in application.allWidgets() if isinstance(widget, widget_class)]